@@ -1 +1,5 @@
-# This file makes 'core' a Python package
\ No newline at end of file
+# This file makes 'core' a Python package
+from dotenv import load_dotenv
+
+# Load .env before any core module reads its settings from the environment at import time
+load_dotenv()
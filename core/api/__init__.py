@@ -9,9 +9,20 @@ This module provides the core data and business logic functions that can be used
 All functions return data structures, not HTML/web responses.
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Iterator, List, Dict, Any
 from datetime import datetime, date
-from core.auth import hash_pin, verify_pin, check_rate_limit, is_valid_username, is_valid_pin, is_valid_slug
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from core.auth import (
+    generate_salt, hash_pin, verify_pin_cached, forget_verified_pin,
+    check_rate_limit, is_rate_limited, remember_failed_attempts,
+    is_valid_username, is_valid_pin, is_valid_slug
+)
+from core.formatting import format_content
 from core.privacy import hash_ip, track_list_view, get_trending_lists
 from core.plugins import on_user_created, on_user_login, on_list_created, on_list_viewed, on_list_updated, on_list_deleted
 
@@ -34,6 +45,29 @@ class ListNotFoundError(ListkyError):
 class UnauthorizedError(ListkyError):
     pass
 
+# Hot-path queries, kept as constants so each maps to one entry in sqlite3's per-connection statement cache
+_LOGIN_LOOKUP_SQL = """
+    SELECT pin_hash, salt, failed_attempts, last_fail, last_ip_hash
+    FROM users
+    WHERE username = ?
+"""
+_GET_LIST_SQL = """
+    SELECT id, title, content, formatted_content, is_public, created_at, updated_at
+    FROM lists
+    WHERE username = ? AND slug = ?
+"""
+_USER_LISTS_SQL = """
+    SELECT slug, title, is_public, created_at, updated_at
+    FROM lists
+    WHERE username = ? AND (? = 1 OR is_public = 1)
+    ORDER BY updated_at DESC
+"""
+
+# Argon2/bcrypt release the GIL, so PIN hashing runs in parallel on these threads.
+# Each hash holds ARGON2_MEMORY_COST KiB while it runs; lower KDF_WORKERS on small hosts.
+KDF_WORKERS = int(os.getenv("KDF_WORKERS", os.cpu_count() or 1))
+_kdf_pool = ThreadPoolExecutor(max_workers=KDF_WORKERS, thread_name_prefix="listky-kdf")
+
 # User Management API
 
 def create_user(username: str, pin: str, client_ip: str, db) -> Dict[str, Any]:
@@ -50,22 +84,24 @@ def create_user(username: str, pin: str, client_ip: str, db) -> Dict[str, Any]:
     if not is_valid_pin(pin):
         raise ListkyError("Invalid PIN: must be exactly 6 digits")
     
-    # Check if username exists
-    cursor = db.cursor()
-    cursor.execute("SELECT username FROM users WHERE username = ?", (username,))
-    if cursor.fetchone():
-        raise UserAlreadyExistsError(f"Username '{username}' is already taken")
-    
-    # Create user
-    pin_hash = hash_pin(pin)
+    # Create user; the insert is skipped (no row returned) if the username is taken
+    salt = generate_salt()
+    pin_hash = hash_pin(pin, salt)
     ip_hash = hash_ip(client_ip)
     
+    cursor = db.cursor()
     cursor.execute("""
-        INSERT INTO users (username, pin_hash, last_ip_hash)
-        VALUES (?, ?, ?)
-    """, (username, pin_hash, ip_hash))
+        INSERT INTO users (username, pin_hash, salt, last_ip_hash)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(username) DO NOTHING
+        RETURNING username
+    """, (username, pin_hash, salt, ip_hash))
+    created = cursor.fetchone()
     db.commit()
     
+    if not created:
+        raise UserAlreadyExistsError(f"Username '{username}' is already taken")
+    
     # Emit plugin hook for user creation
     on_user_created(username=username, client_ip=client_ip)
     
@@ -79,37 +115,66 @@ def authenticate_user(username: str, pin: str, client_ip: str, db) -> Dict[str,
     """
     username = username.lower()
     
-    if not check_rate_limit(username, db):
+    # Users already known to be locked out are rejected without touching the DB
+    if not check_rate_limit(username):
         raise RateLimitError("Too many failed attempts. Please try again later.")
     
     cursor = db.cursor()
-    cursor.execute("SELECT pin_hash FROM users WHERE username = ?", (username,))
+    cursor.execute(_LOGIN_LOOKUP_SQL, (username,))
     result = cursor.fetchone()
     
-    if not result or not verify_pin(pin, result[0]):
+    if result:
+        remember_failed_attempts(username, result["failed_attempts"], result["last_fail"])
+        if is_rate_limited(result["failed_attempts"], result["last_fail"]):
+            raise RateLimitError("Too many failed attempts. Please try again later.")
+    
+    if not result or not verify_pin_cached(username, pin, result["pin_hash"], result["salt"]):
         # Record failed attempt
+        forget_verified_pin(username)
+        last_fail = datetime.now().isoformat()
         cursor.execute("""
             UPDATE users 
             SET failed_attempts = failed_attempts + 1, last_fail = ? 
             WHERE username = ?
-        """, (datetime.now().isoformat(), username))
+        """, (last_fail, username))
         db.commit()
+        if result:
+            remember_failed_attempts(username, result["failed_attempts"] + 1, last_fail)
         raise InvalidCredentialsError("Invalid username or PIN")
     
-    # Successful login - reset failed attempts and update IP
+    pin_hash, salt, failed_attempts, _, last_ip_hash = result
+    remember_failed_attempts(username, 0, None)
     ip_hash = hash_ip(client_ip)
-    cursor.execute("""
-        UPDATE users 
-        SET failed_attempts = 0, last_fail = NULL, last_ip_hash = ?
-        WHERE username = ?
-    """, (ip_hash, username))
-    db.commit()
+    
+    # Successful login - reset failed attempts and update IP, skipping the write if nothing changed
+    if salt is None or failed_attempts or last_ip_hash != ip_hash:
+        if salt is None:
+            # Legacy bcrypt hash - upgrade to Argon2id now that we know the PIN
+            salt = generate_salt()
+            pin_hash = hash_pin(pin, salt)
+        
+        cursor.execute("""
+            UPDATE users 
+            SET failed_attempts = 0, last_fail = NULL, last_ip_hash = ?, pin_hash = ?, salt = ?
+            WHERE username = ?
+        """, (ip_hash, pin_hash, salt, username))
+        db.commit()
     
     # Emit plugin hook for user login
     on_user_login(username=username, client_ip=client_ip)
     
     return {"success": True, "username": username}
 
+async def create_user_async(username: str, pin: str, client_ip: str, db) -> Dict[str, Any]:
+    """create_user for async callers: PIN hashing runs off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_kdf_pool, create_user, username, pin, client_ip, db)
+
+async def authenticate_user_async(username: str, pin: str, client_ip: str, db) -> Dict[str, Any]:
+    """authenticate_user for async callers: PIN verification runs off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_kdf_pool, authenticate_user, username, pin, client_ip, db)
+
 def get_user_info(username: str, db) -> Optional[Dict[str, Any]]:
     """Get basic user information (no sensitive data)"""
     cursor = db.cursor()
@@ -123,10 +188,7 @@ def get_user_info(username: str, db) -> Optional[Dict[str, Any]]:
     if not result:
         return None
         
-    return {
-        "username": result[0],
-        "created_at": result[1]
-    }
+    return dict(result)
 
 # List Management API
 
@@ -147,20 +209,21 @@ def create_list(username: str, slug: str, title: str, content: str, is_public: b
     if not content or len(content) > 10000:
         raise ListkyError("Content must be 1-10,000 characters")
     
-    # Check if list already exists for this user
+    # Create list; the insert is skipped (no row returned) if the slug is taken for this user
     cursor = db.cursor()
-    cursor.execute("SELECT id FROM lists WHERE username = ? AND slug = ?", (username, slug))
-    if cursor.fetchone():
-        raise ListkyError(f"List '{slug}' already exists for user '{username}'")
-    
-    # Create list
     cursor.execute("""
-        INSERT INTO lists (username, slug, title, content, is_public)
-        VALUES (?, ?, ?, ?, ?)
-    """, (username, slug, title, content, is_public))
+        INSERT INTO lists (username, slug, title, content, formatted_content, is_public)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(username, slug) DO NOTHING
+        RETURNING id
+    """, (username, slug, title, content, format_content(content), is_public))
+    created = cursor.fetchone()
     db.commit()
     
-    list_id = cursor.lastrowid
+    if not created:
+        raise ListkyError(f"List '{slug}' already exists for user '{username}'")
+    
+    list_id = created[0]
     
     # Emit plugin hook for list creation
     on_list_created(username=username, slug=slug, title=title, is_public=is_public)
@@ -170,26 +233,13 @@ def create_list(username: str, slug: str, title: str, content: str, is_public: b
 def get_list(username: str, slug: str, db) -> Optional[Dict[str, Any]]:
     """Get a list by username and slug"""
     cursor = db.cursor()
-    cursor.execute("""
-        SELECT id, title, content, is_public, created_at, updated_at
-        FROM lists 
-        WHERE username = ? AND slug = ?
-    """, (username.lower(), slug))
+    cursor.execute(_GET_LIST_SQL, (username.lower(), slug))
     result = cursor.fetchone()
     
     if not result:
         return None
     
-    return {
-        "id": result[0],
-        "username": username,
-        "slug": slug,
-        "title": result[1],
-        "content": result[2],
-        "is_public": bool(result[3]),
-        "created_at": result[4],
-        "updated_at": result[5]
-    }
+    return dict(result, username=username, slug=slug, is_public=bool(result["is_public"]))
 
 def update_list(username: str, slug: str, title: str, content: str, is_public: bool, db) -> Dict[str, Any]:
     """Update an existing list"""
@@ -201,18 +251,20 @@ def update_list(username: str, slug: str, title: str, content: str, is_public: b
     if not content or len(content) > 10000:
         raise ListkyError("Content must be 1-10,000 characters")
     
+    # RETURNING yields no row when the list doesn't exist
     cursor = db.cursor()
     cursor.execute("""
         UPDATE lists 
-        SET title = ?, content = ?, is_public = ?, updated_at = CURRENT_TIMESTAMP
+        SET title = ?, content = ?, formatted_content = ?, is_public = ?, updated_at = CURRENT_TIMESTAMP
         WHERE username = ? AND slug = ?
-    """, (title, content, is_public, username, slug))
+        RETURNING id
+    """, (title, content, format_content(content), is_public, username, slug))
+    updated = cursor.fetchone()
+    db.commit()
     
-    if cursor.rowcount == 0:
+    if not updated:
         raise ListNotFoundError(f"List '{slug}' not found for user '{username}'")
     
-    db.commit()
-    
     # Emit plugin hook for list update
     on_list_updated(username=username, slug=slug, title=title)
     
@@ -221,72 +273,50 @@ def update_list(username: str, slug: str, title: str, content: str, is_public: b
 def delete_list(username: str, slug: str, db) -> Dict[str, Any]:
     """Delete a list"""
     cursor = db.cursor()
-    cursor.execute("DELETE FROM lists WHERE username = ? AND slug = ?", (username.lower(), slug))
+    cursor.execute("DELETE FROM lists WHERE username = ? AND slug = ? RETURNING id", (username.lower(), slug))
+    deleted = cursor.fetchone()
+    db.commit()
     
-    if cursor.rowcount == 0:
+    if not deleted:
         raise ListNotFoundError(f"List '{slug}' not found for user '{username}'")
     
-    db.commit()
-    
     # Emit plugin hook for list deletion
     on_list_deleted(username=username, slug=slug)
     
     return {"success": True}
 
-def get_user_lists(username: str, include_private: bool = False, db = None) -> List[Dict[str, Any]]:
-    """Get all lists for a user"""
+def iter_user_lists(username: str, include_private: bool = False, db = None) -> Iterator[Dict[str, Any]]:
+    """Yield a user's lists one at a time, straight from the cursor (for large exports)"""
     cursor = db.cursor()
+    cursor.execute(_USER_LISTS_SQL, (username.lower(), 1 if include_private else 0))
     
-    if include_private:
-        cursor.execute("""
-            SELECT slug, title, is_public, created_at, updated_at
-            FROM lists 
-            WHERE username = ?
-            ORDER BY updated_at DESC
-        """, (username.lower(),))
-    else:
-        cursor.execute("""
-            SELECT slug, title, is_public, created_at, updated_at
-            FROM lists 
-            WHERE username = ? AND is_public = 1
-            ORDER BY updated_at DESC
-        """, (username.lower(),))
-    
-    results = cursor.fetchall()
-    return [{
-        "username": username,
-        "slug": result[0],
-        "title": result[1],
-        "is_public": bool(result[2]),
-        "created_at": result[3],
-        "updated_at": result[4]
-    } for result in results]
+    for result in cursor:
+        yield dict(result, username=username, is_public=bool(result["is_public"]))
+
+def get_user_lists(username: str, include_private: bool = False, db = None) -> List[Dict[str, Any]]:
+    """Get all lists for a user"""
+    return list(iter_user_lists(username, include_private, db))
 
 # Discovery & Analytics API
 
+# Trending changes slowly; cache results per (days, limit) for a minute.
+# The condition makes concurrent misses wait for one query instead of all running it.
+TRENDING_CACHE_TTL = 60  # seconds
+
+@cached(TTLCache(maxsize=16, ttl=TRENDING_CACHE_TTL),
+        key=lambda db, days=7, limit=10: hashkey(days, limit),
+        condition=threading.Condition())
 def get_trending_public_lists(db, days: int = 7, limit: int = 10) -> List[Dict[str, Any]]:
-    """Get trending public lists"""
+    """Get trending public lists (cached for TRENDING_CACHE_TTL seconds)"""
     results = get_trending_lists(db, days, limit)
-    return [{
-        "username": result[0],
-        "slug": result[1],
-        "title": result[2],
-        "view_count": result[3]
-    } for result in results]
+    return [dict(result) for result in results]
 
-def record_list_view(username: str, slug: str, request, db) -> bool:
-    """Record a view for a list"""
-    list_data = get_list(username, slug, db)
-    if not list_data or not list_data["is_public"]:
-        return False
-    
-    # Track the view
-    success = track_list_view(list_data["id"], request, db)
+def record_list_view(username: str, slug: str, client_ip: str, db=None) -> bool:
+    """Record a view for a public list (views of private or missing lists are not stored)"""
+    success = track_list_view(username, slug, client_ip, db)
     
     # Emit plugin hook for list view
     if success:
-        from core.privacy import get_client_ip
-        viewer_ip = get_client_ip(request)
-        on_list_viewed(username=username, slug=slug, viewer_ip=viewer_ip)
+        on_list_viewed(username=username, slug=slug, viewer_ip=client_ip)
     
-    return success
\ No newline at end of file
+    return success
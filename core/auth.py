@@ -1,97 +1,201 @@
 import os
+import time
+import base64
 import hashlib
+import hmac
+import logging
 import bcrypt
-import re
 import secrets
+import string
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from argon2.low_level import hash_secret_raw, Type
+from cachetools import TTLCache
 from fastapi import Request
+from core.privacy import hash_ip, get_client_ip  # re-exported; defined once in core.privacy
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 PIN_SALT = os.getenv("PIN_SALT", "default_development_salt_change_in_production")
 
-# Simple session storage (in-memory, for v1 simplicity)
-active_sessions = {}  # session_token -> {username: str, expires: datetime}
+# Argon2id parameters (OWASP baseline: 19 MiB memory, 2 iterations, 1 lane)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19456
+ARGON2_PARALLELISM = 1
+ARGON2_HASH_LEN = 32
+
+# Sessions are stateless signed tokens ("username.expiry.mac", keyed BLAKE2b), verified in-process.
+# Only logged-out tokens are stored, until they expire: in Redis when REDIS_URL is set
+# (shared by all workers), otherwise in-memory, keyed by a SHA-256 of the token.
+SESSION_TTL = 24 * 3600  # 24 hour sessions
+MAX_SESSIONS = 100_000
+SESSION_SECRET = os.getenv("SESSION_SECRET")
+if SESSION_SECRET:
+    _SESSION_KEY = hashlib.blake2b(SESSION_SECRET.encode('utf-8'), digest_size=32).digest()  # fits BLAKE2b's 64-byte key limit
+elif int(os.getenv("WEB_CONCURRENCY", "1")) > 1:
+    # A per-process key would only accept cookies made by the same worker
+    raise RuntimeError("SESSION_SECRET must be set when running more than one worker")
+else:
+    # Never derive the key from public defaults: without a secret, sign with a per-process random key
+    logger.warning("SESSION_SECRET is not set; sessions will not survive a restart or be shared between workers")
+    _SESSION_KEY = secrets.token_bytes(32)
+REDIS_URL = os.getenv("REDIS_URL")
+revoked_sessions = TTLCache(maxsize=MAX_SESSIONS, ttl=SESSION_TTL)  # token digest -> True
+
+if REDIS_URL:
+    import redis
+    _redis = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+else:
+    _redis = None
+
+# Recently verified PINs (in-memory LRU): username -> (hmac of PIN, stored hash)
+VERIFY_CACHE_SIZE = 4096
+_verified_pins: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+# Failed-login counters: username -> (failed_attempts, last_fail); entries outlive the longest lockout
+_failed_logins = TTLCache(maxsize=10_000, ttl=3600)
+_failed_logins_lock = threading.Lock()
+
+def generate_salt() -> str:
+    """Generate a random per-user salt for PIN hashing"""
+    return secrets.token_hex(16)
+
+def hash_pin(pin: str, salt: str) -> str:
+    """Hash a PIN with Argon2id using the user's salt"""
+    return hash_secret_raw(
+        secret=(pin + PIN_SALT).encode('utf-8'),
+        salt=bytes.fromhex(salt),
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=ARGON2_MEMORY_COST,
+        parallelism=ARGON2_PARALLELISM,
+        hash_len=ARGON2_HASH_LEN,
+        type=Type.ID
+    ).hex()
+
+def verify_pin(pin: str, hashed: str, salt: Optional[str] = None) -> bool:
+    """Verify a PIN against its hash (accounts without a salt still have a legacy bcrypt hash)"""
+    if salt is None:
+        return bcrypt.checkpw((pin + PIN_SALT).encode('utf-8'), hashed.encode('utf-8'))
+    return hmac.compare_digest(hash_pin(pin, salt), hashed)
 
-def hash_pin(pin: str) -> str:
-    """Hash a PIN with bcrypt"""
-    return bcrypt.hashpw((pin + PIN_SALT).encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+def _pin_mac(pin: str) -> str:
+    """Keyed digest of a PIN, so the verification cache never holds raw PINs"""
+    return hmac.new(PIN_SALT.encode('utf-8'), pin.encode('utf-8'), hashlib.sha256).hexdigest()
 
-def verify_pin(pin: str, hashed: str) -> bool:
-    """Verify a PIN against its hash"""
-    return bcrypt.checkpw((pin + PIN_SALT).encode('utf-8'), hashed.encode('utf-8'))
+def verify_pin_cached(username: str, pin: str, hashed: str, salt: Optional[str] = None) -> bool:
+    """Verify a PIN, skipping the KDF when this username/PIN/hash was verified recently"""
+    key = (_pin_mac(pin), hashed)
+    with _verified_lock:
+        if _verified_pins.get(username) == key:
+            _verified_pins.move_to_end(username)
+            return True
+    
+    if not verify_pin(pin, hashed, salt):
+        return False
+    
+    with _verified_lock:
+        _verified_pins[username] = key
+        _verified_pins.move_to_end(username)
+        if len(_verified_pins) > VERIFY_CACHE_SIZE:
+            _verified_pins.popitem(last=False)
+    return True
 
-def hash_ip(ip: str) -> str:
-    """Hash IP address with salt for privacy-preserving storage"""
-    return hashlib.sha256((ip + PIN_SALT).encode('utf-8')).hexdigest()
+def forget_verified_pin(username: str):
+    """Drop a user's cached PIN verification (called on failed attempts)"""
+    with _verified_lock:
+        _verified_pins.pop(username, None)
 
-def get_client_ip(request: Request) -> str:
-    """Get client IP from request, handling proxies"""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(',')[0].strip()
-    return request.client.host
+# Usernames and slugs repeat heavily across requests, so validator results are memoized.
+# The length bound is checked before the cache, so it only ever holds short strings.
+# (PINs are never cached: they are secrets.)
+VALIDATOR_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _is_valid_username(username: str) -> bool:
+    return username.isascii() and username.isalnum()
 
 def is_valid_username(username: str) -> bool:
     """Validate username: 3-20 alphanumeric chars"""
-    return bool(re.match(r'^[a-zA-Z0-9]{3,20}$', username))
+    return 3 <= len(username) <= 20 and _is_valid_username(username)
 
 def is_valid_pin(pin: str) -> bool:
     """Validate PIN: exactly 6 digits"""
-    return bool(re.match(r'^\d{6}$', pin))
+    return len(pin) == 6 and pin.isascii() and pin.isdigit()
+
+# Characters allowed in a slug; bytes.translate deletes them, so a valid slug leaves nothing behind
+_SLUG_CHARS = (string.ascii_letters + string.digits + '-').encode('ascii')
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _is_valid_slug(slug: str) -> bool:
+    return slug.isascii() and not slug.encode('ascii').translate(None, _SLUG_CHARS)
 
 def is_valid_slug(slug: str) -> bool:
     """Validate list slug: alphanumeric + hyphens, 1-50 chars"""
-    return bool(re.match(r'^[a-zA-Z0-9-]{1,50}$', slug))
+    return 1 <= len(slug) <= 50 and _is_valid_slug(slug)
+
+def _session_key(session_token: str) -> str:
+    return "sess:" + hashlib.sha256(session_token.encode('utf-8')).hexdigest()
+
+def _sign_session(payload: str) -> str:
+    digest = hashlib.blake2b(payload.encode('utf-8'), key=_SESSION_KEY, digest_size=32).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+def _parse_session(session_token: str) -> Optional[Tuple[str, int]]:
+    """Return (username, expiry) for a correctly signed, unexpired token"""
+    parts = session_token.split('.')
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    username, exp, signature = parts
+    # Compare bytes: compare_digest rejects str with non-ASCII characters
+    if not hmac.compare_digest(signature.encode('utf-8'), _sign_session(f"{username}.{exp}").encode('ascii')):
+        return None
+    if int(exp) <= time.time():
+        return None
+    return username, int(exp)
 
 def create_session(username: str) -> str:
     """Create a new session token for the user"""
-    token = secrets.token_urlsafe(32)
-    expires = datetime.now() + timedelta(hours=24)  # 24 hour sessions
-    active_sessions[token] = {
-        'username': username,
-        'expires': expires
-    }
-    return token
+    payload = f"{username}.{int(time.time()) + SESSION_TTL}"
+    return f"{payload}.{_sign_session(payload)}"
 
 def get_session_user(request: Request) -> Optional[str]:
     """Get the username from the session token in cookies"""
     session_token = request.cookies.get('session')
-    if not session_token or session_token not in active_sessions:
+    if not session_token:
         return None
-    
-    session_data = active_sessions[session_token]
-    if datetime.now() > session_data['expires']:
-        # Session expired, clean it up
-        del active_sessions[session_token]
+    session = _parse_session(session_token)
+    if session is None:
         return None
-    
-    return session_data['username']
+    key = _session_key(session_token)
+    if _redis is not None:
+        revoked = _redis.exists(key)
+    else:
+        revoked = key in revoked_sessions
+    return None if revoked else session[0]
 
 def clear_session(session_token: str):
-    """Clear a session token"""
-    if session_token in active_sessions:
-        del active_sessions[session_token]
-
-def check_rate_limit(username: str, db) -> bool:
-    """Check if user is rate limited due to failed login attempts"""
-    cursor = db.cursor()
-    cursor.execute("SELECT failed_attempts, last_fail FROM users WHERE username = ?", (username,))
-    result = cursor.fetchone()
-    
-    if not result:
-        return True  # User doesn't exist, allow
-    
-    failed_attempts, last_fail_str = result
-    
+    """Revoke a session token until it would have expired anyway"""
+    session = _parse_session(session_token)
+    if session is None:
+        return
+    key = _session_key(session_token)
+    if _redis is not None:
+        _redis.setex(key, max(1, session[1] - int(time.time())), 1)
+    else:
+        revoked_sessions[key] = True
+
+def is_rate_limited(failed_attempts: int, last_fail: Optional[str]) -> bool:
+    """Check failed-login counters against the progressive lockout windows"""
     if failed_attempts < 4:
-        return True
+        return False
     
-    if not last_fail_str:
-        return True
-        
-    last_fail = datetime.fromisoformat(last_fail_str)
-    now = datetime.now()
+    if not last_fail:
+        return False
     
     # Progressive lockouts: 4+ fails = 5 min, 6+ fails = 15 min, 8+ fails = 60 min
     if failed_attempts >= 8:
@@ -101,4 +205,33 @@ def check_rate_limit(username: str, db) -> bool:
     else:
         lockout_minutes = 5
     
-    return (now - last_fail) > timedelta(minutes=lockout_minutes)
\ No newline at end of file
+    return (datetime.now() - datetime.fromisoformat(last_fail)) <= timedelta(minutes=lockout_minutes)
+
+def remember_failed_attempts(username: str, failed_attempts: int, last_fail: Optional[str]):
+    """Mirror a user's failed-login counters in memory (the users table stays the durable copy)"""
+    with _failed_logins_lock:
+        if failed_attempts:
+            _failed_logins[username] = (failed_attempts, last_fail)
+        else:
+            _failed_logins.pop(username, None)
+
+def check_rate_limit(username: str, db=None) -> bool:
+    """
+    Check if user is allowed to try logging in (False while locked out).
+    Uses the in-memory counters when known, otherwise reads them from db if given.
+    """
+    with _failed_logins_lock:
+        counters = _failed_logins.get(username)
+    
+    if counters is None:
+        if db is None:
+            return True
+        cursor = db.cursor()
+        cursor.execute("SELECT failed_attempts, last_fail FROM users WHERE username = ?", (username,))
+        result = cursor.fetchone()
+        if not result:
+            return True  # User doesn't exist, allow
+        counters = (result[0], result[1])
+        remember_failed_attempts(username, *counters)
+    
+    return not is_rate_limited(*counters)
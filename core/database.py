@@ -1,51 +1,149 @@
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
+from core.formatting import format_content, FORMAT_VERSION
 
 DATABASE = "/app/data/listky.db"
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in init_db
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "mmap_size=268435456",
+    "cache_size=-64000",
+    "temp_store=MEMORY",
+)
+
+# Idle connections kept open between requests (roughly one per worker thread)
+POOL_SIZE = 8
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+_open_connections = 0  # pooled + checked out
+_open_lock = threading.Lock()
+
+def _connect() -> sqlite3.Connection:
+    global _open_connections
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, cached_statements=256, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    with _open_lock:
+        _open_connections += 1
+    return conn
+
+def _close(conn: sqlite3.Connection):
+    global _open_connections
+    conn.close()
+    with _open_lock:
+        _open_connections -= 1
+
+def _acquire() -> sqlite3.Connection:
+    """Take an idle pooled connection, or open a new one"""
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+def _release(conn: sqlite3.Connection):
+    """Return a connection to the pool, closing it if the pool is full"""
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        _close(conn)
+
+def pool_stats() -> dict:
+    """Connection counts for monitoring: in use, idle in the pool, and total open"""
+    idle = _pool.qsize()
+    total = _open_connections
+    return {"active": max(total - idle, 0), "idle": idle, "total": total, "max_idle": POOL_SIZE}
+
+def _ensure_column(c, table: str, column: str, definition: str):
+    """Add a column to a table created before the column existed"""
+    columns = {row[1] for row in c.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
 def init_db():
-    with sqlite3.connect(DATABASE, check_same_thread=False) as conn:
-        c = conn.cursor()
-        c.execute('''CREATE TABLE IF NOT EXISTS users (
-            username TEXT PRIMARY KEY,
-            pin_hash TEXT NOT NULL,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            last_ip_hash TEXT,
-            failed_attempts INTEGER DEFAULT 0,
-            last_fail DATETIME
-        )''')
-        c.execute('''CREATE TABLE IF NOT EXISTS lists (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT,
-            slug TEXT NOT NULL,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            is_public BOOLEAN DEFAULT FALSE,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (username) REFERENCES users(username)
-        )''')
-        c.execute('''CREATE TABLE IF NOT EXISTS views (
-            list_id INTEGER,
-            view_date DATE,
-            ip_hash TEXT,
-            PRIMARY KEY (list_id, view_date, ip_hash),
-            FOREIGN KEY (list_id) REFERENCES lists(id)
-        )''')
-        conn.commit()
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")  # can't be changed inside a transaction
+        # Schema, migrations and backfill apply all-or-nothing with a single commit;
+        # BEGIN IMMEDIATE also keeps workers starting together from migrating at once
+        with transaction(conn):
+            c = conn.cursor()
+            c.execute('''CREATE TABLE IF NOT EXISTS users (
+                username TEXT PRIMARY KEY,
+                pin_hash TEXT NOT NULL,
+                salt TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                last_ip_hash TEXT,
+                failed_attempts INTEGER DEFAULT 0,
+                last_fail DATETIME
+            )''')
+            _ensure_column(c, "users", "salt", "TEXT")
+            c.execute('''CREATE TABLE IF NOT EXISTS lists (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT,
+                slug TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                formatted_content TEXT,
+                is_public BOOLEAN DEFAULT FALSE,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (username) REFERENCES users(username)
+            )''')
+            _ensure_column(c, "lists", "formatted_content", "TEXT")
+            # Backfill lists saved before formatted_content was stored; re-render every list
+            # once when the formatter changes (user_version holds the last FORMAT_VERSION applied)
+            if c.execute("PRAGMA user_version").fetchone()[0] < FORMAT_VERSION:
+                stale = c.execute("SELECT id, content FROM lists").fetchall()
+                c.execute(f"PRAGMA user_version={FORMAT_VERSION:d}")
+            else:
+                stale = c.execute("SELECT id, content FROM lists WHERE formatted_content IS NULL").fetchall()
+            c.executemany("UPDATE lists SET formatted_content = ? WHERE id = ?",
+                          [(format_content(content), list_id) for list_id, content in stale])
+            c.execute('''CREATE TABLE IF NOT EXISTS views (
+                list_id INTEGER,
+                view_date DATE,
+                ip_hash TEXT,
+                PRIMARY KEY (list_id, view_date, ip_hash),
+                FOREIGN KEY (list_id) REFERENCES lists(id)
+            )''')
+            # views lookups by (list_id, view_date) are already served by its primary key
+            c.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_lists_user_slug ON lists(username, slug)")
+            # Covering index for trending: date range scan without touching the views table
+            c.execute("CREATE INDEX IF NOT EXISTS ix_views_date_listid ON views(view_date, list_id, ip_hash)")
+            # Refresh planner statistics; the limit keeps this a bounded sample on large databases
+            c.execute("PRAGMA analysis_limit=400")
+            c.execute("ANALYZE")
+    finally:
+        conn.close()
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """Run several statements as one write transaction, taking the write lock up front"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
 
 @contextmanager
 def get_db_context():
-    conn = sqlite3.connect(DATABASE, check_same_thread=False)
+    conn = _acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        _release(conn)
 
 def get_db():
     """FastAPI dependency to get database connection"""
-    conn = sqlite3.connect(DATABASE, check_same_thread=False)
+    conn = _acquire()
     try:
         yield conn
     finally:
-        conn.close()
\ No newline at end of file
+        _release(conn)
\ No newline at end of file
@@ -0,0 +1,63 @@
+import re
+from markupsafe import escape
+
+# RE2 scans in linear time, so hostile list content can't trigger regex backtracking
+try:
+    import re2 as _url_re_engine
+except ImportError:
+    _url_re_engine = re
+
+_URL_PATTERN = r"""https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"'{}|\\^`\[\].,;:]"""
+_URL_RE = _url_re_engine.compile(_URL_PATTERN)
+_URL_SUB = r'<a href="\g<0>" target="_blank" rel="noopener">\g<0></a>'
+
+# Bold, italic and links in one alternation, so each line is scanned once
+_FORMAT_RE = _url_re_engine.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|(' + _URL_PATTERN + ')')
+_BULLET_RE = re.compile(r'^[•\-\*]\s*')
+
+# Stored formatted_content is re-rendered at startup when this is raised (see core.database)
+FORMAT_VERSION = 1
+
+def _link(url: str) -> str:
+    url = escape(url)
+    return f'<a href="{url}" target="_blank" rel="noopener">{url}</a>'
+
+def make_links(text):
+    """Convert URLs in text to clickable links"""
+    return _URL_RE.sub(_URL_SUB, text)
+
+def _escape_with_links(text: str) -> str:
+    """Escape raw text, turning the URLs in it into links"""
+    out, pos = [], 0
+    for match in _URL_RE.finditer(text):
+        out.append(escape(text[pos:match.start()]))
+        out.append(_link(match.group(0)))
+        pos = match.end()
+    out.append(escape(text[pos:]))
+    return ''.join(out)
+
+def _format_line(line: str) -> str:
+    # Matching runs on the raw line, so the URL pattern's quote and bracket exclusions apply;
+    # every piece of text is escaped as the output is built
+    out, pos = [], 0
+    for match in _FORMAT_RE.finditer(line):
+        out.append(escape(line[pos:match.start()]))
+        bold, italic, url = match.groups()
+        if url is not None:
+            out.append(_link(url))
+        elif bold is not None:
+            out.append(f"<strong>{_escape_with_links(bold)}</strong>")
+        else:
+            out.append(f"<em>{_escape_with_links(italic)}</em>")
+        pos = match.end()
+    out.append(escape(line[pos:]))
+    return ''.join(out)
+
+def format_content(content: str) -> str:
+    """Render list content as the HTML shown on the list page (one <li> per non-empty line)"""
+    items = []
+    for line in content.split('\n'):
+        line = line.strip()
+        if line:
+            items.append(f"<li>{_format_line(_BULLET_RE.sub('', line, count=1))}</li>")
+    return f"<ul>{''.join(items)}</ul>" if items else ""
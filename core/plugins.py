@@ -14,7 +14,7 @@ The core platform emits events at key points, and premium plugins can listen
 to these events to provide enhanced functionality.
 """
 
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, FrozenSet, List, Callable, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +22,8 @@ logger = logging.getLogger(__name__)
 # Plugin registry
 _plugins: Dict[str, List[Callable]] = {}
 _plugin_config: Dict[str, Any] = {}
+# Events with at least one registered hook; lets on_* helpers return before building a payload
+_active_events: FrozenSet[str] = frozenset()
 
 def register_hook(event: str, callback: Callable):
     """
@@ -31,9 +33,11 @@ def register_hook(event: str, callback: Callable):
         event: Event name (e.g., 'user_created', 'list_viewed')
         callback: Function to call when event occurs
     """
+    global _active_events
     if event not in _plugins:
         _plugins[event] = []
     _plugins[event].append(callback)
+    _active_events = _active_events | {event}
     logger.info(f"Registered plugin hook for event: {event}")
 
 def emit_event(event: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,7 +54,7 @@ def emit_event(event: str, data: Dict[str, Any]) -> Dict[str, Any]:
     if event not in _plugins:
         return data
     
-    logger.debug(f"Emitting event: {event}")
+    logger.debug("Emitting event: %s", event)
     for callback in _plugins[event]:
         try:
             result = callback(data)
@@ -80,10 +84,13 @@ def is_plugin_enabled(plugin_name: str) -> bool:
         return False
     return config.get('enabled', False)
 
-# Core events that premium plugins can hook into:
+# Core events that premium plugins can hook into.
+# Each helper returns the (possibly plugin-updated) event data, or None when nothing listens.
 
 def on_user_created(username: str, client_ip: str, **kwargs):
     """Called when a new user account is created"""
+    if 'user_created' not in _active_events:
+        return None
     return emit_event('user_created', {
         'username': username,
         'client_ip': client_ip,
@@ -92,6 +99,8 @@ def on_user_created(username: str, client_ip: str, **kwargs):
 
 def on_user_login(username: str, client_ip: str, **kwargs):
     """Called when a user logs in"""
+    if 'user_login' not in _active_events:
+        return None
     return emit_event('user_login', {
         'username': username,
         'client_ip': client_ip,
@@ -100,6 +109,8 @@ def on_user_login(username: str, client_ip: str, **kwargs):
 
 def on_list_created(username: str, slug: str, title: str, is_public: bool, **kwargs):
     """Called when a new list is created"""
+    if 'list_created' not in _active_events:
+        return None
     return emit_event('list_created', {
         'username': username,
         'slug': slug,
@@ -110,6 +121,8 @@ def on_list_created(username: str, slug: str, title: str, is_public: bool, **kwa
 
 def on_list_viewed(username: str, slug: str, viewer_ip: str, **kwargs):
     """Called when a list is viewed"""
+    if 'list_viewed' not in _active_events:
+        return None
     return emit_event('list_viewed', {
         'username': username,
         'slug': slug,
@@ -119,6 +132,8 @@ def on_list_viewed(username: str, slug: str, viewer_ip: str, **kwargs):
 
 def on_list_updated(username: str, slug: str, title: str, **kwargs):
     """Called when a list is updated"""
+    if 'list_updated' not in _active_events:
+        return None
     return emit_event('list_updated', {
         'username': username,
         'slug': slug,
@@ -128,6 +143,8 @@ def on_list_updated(username: str, slug: str, title: str, **kwargs):
 
 def on_list_deleted(username: str, slug: str, **kwargs):
     """Called when a list is deleted"""
+    if 'list_deleted' not in _active_events:
+        return None
     return emit_event('list_deleted', {
         'username': username,
         'slug': slug,
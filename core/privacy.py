@@ -1,60 +1,158 @@
 import os
+import asyncio
 import hashlib
-from datetime import date
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
 from fastapi import Request
+from core.database import get_db_context, transaction
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 PIN_SALT = os.getenv("PIN_SALT", "default_development_salt_change_in_production")
 
+# SHA-256 state with the salt already absorbed; copied per call so only the IP is hashed
+_SALT_CTX = hashlib.sha256(PIN_SALT.encode('utf-8'))
+
 def hash_ip(ip: str) -> str:
     """Hash IP address with salt for privacy-preserving storage"""
-    return hashlib.sha256((ip + PIN_SALT).encode('utf-8')).hexdigest()
+    ctx = _SALT_CTX.copy()
+    ctx.update(ip.encode('utf-8'))
+    return ctx.hexdigest()
 
 def get_client_ip(request: Request) -> str:
-    """Get client IP from request, handling proxies"""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(',')[0].strip()
+    """Get client IP from request (uvicorn's --proxy-headers has already applied X-Forwarded-For)"""
     return request.client.host
 
-def track_list_view(list_id: int, request: Request, db) -> bool:
+# View batching: rows are queued and written by run_view_flusher in one transaction
+VIEW_BATCH_SIZE = 500
+VIEW_FLUSH_INTERVAL = 0.2  # seconds
+
+# Resolves the list and inserts the view in one statement; private lists match no row
+_INSERT_VIEW_SQL = """
+    INSERT OR IGNORE INTO views (list_id, view_date, ip_hash)
+    SELECT id, ?, ? FROM lists
+    WHERE username = ? AND slug = ? AND is_public = 1
+"""
+
+_view_queue: Optional[asyncio.Queue] = None
+_view_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _write_views(pending: List[Tuple[str, str, str, str]]):
+    """Hash the queued viewer IPs and insert the batch in a single transaction"""
+    rows = [(view_date, hash_ip(ip), username, slug) for view_date, ip, username, slug in pending]
+    with get_db_context() as db, transaction(db):
+        db.executemany(_INSERT_VIEW_SQL, rows)
+
+def _drain_views(limit: Optional[int] = None) -> List[Tuple[str, str, str, str]]:
+    rows = []
+    while not _view_queue.empty() and (limit is None or len(rows) < limit):
+        rows.append(_view_queue.get_nowait())
+    return rows
+
+def _enqueue_view(row: Tuple[str, str, str, str]) -> bool:
+    """Hand a view row to the flusher; False if the flusher is not running"""
+    queue, loop = _view_queue, _view_loop
+    if queue is None:
+        return False
+    try:
+        on_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        on_loop = False
+    if on_loop:
+        queue.put_nowait(row)
+    else:
+        loop.call_soon_threadsafe(queue.put_nowait, row)
+    return True
+
+async def run_view_flusher():
     """
-    Track a list view in a privacy-preserving way.
+    Background task that writes queued list views in batches.
+    Runs until cancelled; views still queued at that point are written before exiting.
+    """
+    global _view_queue, _view_loop
+    _view_queue, _view_loop = asyncio.Queue(), asyncio.get_running_loop()
+    held = []  # taken off the queue but not yet handed to a writer thread
+    try:
+        while True:
+            held = [await _view_queue.get()]
+            await asyncio.sleep(VIEW_FLUSH_INTERVAL)
+            rows = held + _drain_views(VIEW_BATCH_SIZE - 1)
+            held = []  # a started write finishes in its thread even if this task is cancelled
+            try:
+                await asyncio.to_thread(_write_views, rows)
+            except Exception as e:
+                logger.error(f"Failed to record {len(rows)} list views: {e}")
+    except asyncio.CancelledError:
+        rows = held + _drain_views()
+        _view_queue = _view_loop = None
+        if rows:
+            _write_views(rows)
+        raise
+
+# (today's ISO date, epoch time at which tomorrow starts); recomputed once a day
+_today: Tuple[str, float] = ("", 0.0)
+
+def _today_iso() -> str:
+    """date.today().isoformat(), only rebuilt when the local date changes"""
+    global _today
+    today_iso, tomorrow_starts = _today
+    if time.time() >= tomorrow_starts:
+        today = date.today()
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        today_iso = today.isoformat()
+        _today = (today_iso, tomorrow.timestamp())
+    return today_iso
+
+def track_list_view(username: str, slug: str, client_ip: str, db=None) -> bool:
+    """
+    Track a view of a public list in a privacy-preserving way.
     Uses hashed IP + date to prevent double-counting while preserving privacy.
+    When the view flusher is running the view is queued and written in a later batch.
+    Without a db connection the inline write uses a pooled connection of its own.
     
-    Returns True if view was successfully tracked, False otherwise.
+    Returns True if a new view was tracked (or queued), False otherwise.
     """
     try:
-        ip_hash = hash_ip(get_client_ip(request))
-        today = date.today().isoformat()
+        today = _today_iso()
+        # Queued views carry the raw IP; the flusher hashes the whole batch off the event loop
+        if _enqueue_view((today, client_ip, username.lower(), slug)):
+            return True
         
-        cursor = db.cursor()
-        cursor.execute("""
-            INSERT OR IGNORE INTO views (list_id, view_date, ip_hash)
-            VALUES (?, ?, ?)
-        """, (list_id, today, ip_hash))
-        db.commit()
-        return True
+        if db is None:
+            with get_db_context() as db:
+                return _insert_view(db, today, client_ip, username, slug)
+        return _insert_view(db, today, client_ip, username, slug)
     except Exception:
         # Ignore view tracking errors - privacy tracking should never break core functionality
         return False
 
+def _insert_view(db, today: str, client_ip: str, username: str, slug: str) -> bool:
+    cursor = db.cursor()
+    cursor.execute(_INSERT_VIEW_SQL, (today, hash_ip(client_ip), username.lower(), slug))
+    db.commit()
+    return cursor.rowcount > 0
+
+_TRENDING_SQL = """
+    SELECT l.username, l.slug, l.title, COUNT(DISTINCT v.ip_hash) as view_count
+    FROM lists l
+    JOIN views v ON l.id = v.list_id
+    WHERE l.is_public = 1
+    AND v.view_date >= date('now', ?)
+    GROUP BY l.id, l.username, l.slug, l.title
+    ORDER BY view_count DESC
+    LIMIT ?
+"""
+
 def get_trending_lists(db, days: int = 7, limit: int = 10):
     """
     Get trending public lists based on unique daily views.
     Privacy-preserving: counts unique hashed IPs per day, not actual IPs.
     """
     cursor = db.cursor()
-    cursor.execute("""
-        SELECT l.username, l.slug, l.title, COUNT(DISTINCT v.ip_hash) as view_count
-        FROM lists l
-        JOIN views v ON l.id = v.list_id 
-        WHERE l.is_public = 1 
-        AND v.view_date >= date('now', '-{} days')
-        GROUP BY l.id, l.username, l.slug, l.title
-        ORDER BY view_count DESC
-        LIMIT ?
-    """.format(days), (limit,))
+    cursor.execute(_TRENDING_SQL, (f'-{int(days)} days', limit))
     return cursor.fetchall()
 
 def anonymize_user_data(username: str, db):
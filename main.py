@@ -1,50 +1,166 @@
 import os
+import hashlib
+import asyncio
+import contextlib
+import orjson
 from typing import Optional
-from fastapi import FastAPI, Form, Request, HTTPException, Depends, Response
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Form, Request, HTTPException, Depends, Response, BackgroundTasks
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from dotenv import load_dotenv
+from fastapi.middleware.gzip import GZipMiddleware
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from cachetools import TTLCache
 
-# Import core modules
-from core.database import init_db, get_db
+# Import core modules (importing core loads .env)
+from core.database import init_db, get_db, get_db_context, pool_stats
 from core.auth import (
     create_session, get_session_user, clear_session,
     is_valid_username, is_valid_pin, is_valid_slug
 )
 from core.api import (
-    create_user, authenticate_user, get_user_info,
+    create_user_async, authenticate_user_async, get_user_info,
     create_list, get_list, update_list, delete_list, get_user_lists,
-    get_trending_public_lists, record_list_view,
+    get_trending_public_lists, record_list_view, TRENDING_CACHE_TTL,
     ListkyError, UserAlreadyExistsError, InvalidCredentialsError, 
     RateLimitError, ListNotFoundError, UnauthorizedError
 )
-from core.privacy import get_client_ip
+from core.privacy import get_client_ip, run_view_flusher
 
-# Load environment variables
-load_dotenv()
+app = FastAPI(title="listky.top", description="One-word lists. Privacy first.",
+              default_response_class=ORJSONResponse)
 
-app = FastAPI(title="listky.top", description="One-word lists. Privacy first.")
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Pages are repetitive HTML; small responses aren't worth the compression overhead
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Setup templates and static files
-templates = Jinja2Templates(directory="web/templates")
-app.mount("/static", StaticFiles(directory="web/static"), name="static")
+# Compiled templates are cached on disk and kept in memory; only DEBUG re-checks template mtimes
+template_env = Environment(
+    loader=FileSystemLoader("web/templates"),
+    autoescape=True,
+    auto_reload=DEBUG,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache()
+)
+templates = Jinja2Templates(env=template_env)
+
+def _templates_version(names) -> str:
+    """Digest of the template sources, so page ETags change when a deploy changes the markup"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in names:
+        digest.update(template_env.loader.get_source(template_env, name)[0].encode('utf-8'))
+    return digest.hexdigest()
+
+# view_list.html extends base.html; asset ?v= versions live in these files too
+VIEW_LIST_VERSION = _templates_version(["view_list.html", "base.html"])
 
-# Initialize DB on startup
-init_db()
+# Jinja yields a piece per template node; each body chunk costs a threadpool hop and a gzip
+# flush, so pieces are joined into blocks of about this size before they are sent
+STREAM_BLOCK_SIZE = 8192
 
-def make_links(text):
-    """Convert URLs in text to clickable links"""
-    import re
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:]'
-    return re.sub(url_pattern, r'<a href="\g<0>" target="_blank" rel="noopener">\g<0></a>', text)
+def _blocks(pieces):
+    buffer, size = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_BLOCK_SIZE:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+def stream_template(name: str, context: dict, **kwargs) -> StreamingResponse:
+    """Send a template as it renders, for pages whose size grows with user content"""
+    return StreamingResponse(_blocks(templates.get_template(name).generate(context)), media_type="text/html", **kwargs)
+
+def see_other(url: str) -> Response:
+    """303 redirect after a form post; URLs here are built from validated names, so no quoting is needed"""
+    return Response(status_code=303, headers={"location": url})
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep assets for a week (templates bump ?v= when they change)"""
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("Cache-Control", "public, max-age=604800")
+        return response
+
+# Behind nginx/Caddy, set SERVE_STATIC=false and let the proxy serve /static from web/static
+SERVE_STATIC = os.getenv("SERVE_STATIC", "true").lower() == "true"
+if SERVE_STATIC:
+    app.mount("/static", CachedStaticFiles(directory="web/static", check_dir=False), name="static")
+
+@app.on_event("startup")
+async def startup():
+    # Schema setup runs once per process, not on import
+    init_db()
+    app.state.view_flusher = asyncio.create_task(run_view_flusher())
+
+@app.on_event("shutdown")
+async def stop_view_flusher():
+    app.state.view_flusher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.view_flusher
+
+class CurrentUserMiddleware:
+    """Look up the session once per request; handlers read request.state.current_user.
+    Plain ASGI rather than BaseHTTPMiddleware, so requests pass through without extra wrapping."""
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith("/static/"):
+            request = Request(scope)
+            current_user = None
+            if request.cookies.get('session'):
+                # May be a Redis round-trip, so keep it off the event loop
+                current_user = await asyncio.to_thread(get_session_user, request)
+            request.state.current_user = current_user
+        await self.app(scope, receive, send)
+
+app.add_middleware(CurrentUserMiddleware)
+
+async def norm_user(username: str) -> str:
+    """Path dependency: {username} lowercased, or 404 if it can't be a valid username"""
+    username = username.lower()
+    if not is_valid_username(username):
+        raise HTTPException(status_code=404, detail="User not found")
+    return username
+
+async def norm_slug(slug: str) -> str:
+    """Path dependency: {slug}, or 404 if it can't be a valid slug"""
+    if not is_valid_slug(slug):
+        raise HTTPException(status_code=404, detail="List not found")
+    return slug
+
+async def require_owner(request: Request, username: str = Depends(norm_user)) -> str:
+    """Dependency for owner-only routes: the logged-in user, or 403 if they don't own {username}"""
+    current_user = request.state.current_user
+    if not current_user or current_user.lower() != username:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return current_user
+
+# The logged-out home page only changes when trending does, so it is rendered once per refresh
+_anonymous_home = TTLCache(maxsize=1, ttl=TRENDING_CACHE_TTL)
+
+def _home_trending():
+    # Takes its own connection, so cached home page hits never touch the pool
+    with get_db_context() as db:
+        return get_trending_public_lists(db, days=7, limit=5)
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request, db = Depends(get_db)):
-    current_user = get_session_user(request)
+async def home(request: Request):
+    current_user = request.state.current_user
     
-    # Get trending lists
-    trending_data = get_trending_public_lists(db, days=7, limit=5)
+    if current_user is None:
+        page = _anonymous_home.get("page")
+        if page is not None:
+            return HTMLResponse(content=page)
+    
+    # Get trending lists (a DB query on a cache miss, so run it off the event loop)
+    trending_data = await asyncio.to_thread(_home_trending)
     
     context = {
         "request": request,
@@ -53,6 +169,10 @@ async def home(request: Request, db = Depends(get_db)):
         "welcome_message": f"Welcome back, {current_user}!" if current_user else None
     }
     
+    if current_user is None:
+        page = _anonymous_home["page"] = templates.get_template("home.html").render(context).encode('utf-8')
+        return HTMLResponse(content=page)
+    
     return templates.TemplateResponse("home.html", context)
 
 @app.get("/signup", response_class=HTMLResponse)
@@ -67,9 +187,9 @@ async def signup(request: Request, username: str = Form(...), pin: str = Form(..
             raise ListkyError("PINs do not match")
         
         client_ip = get_client_ip(request)
-        result = create_user(username, pin, client_ip, db)
+        result = await create_user_async(username, pin, client_ip, db)
         
-        return RedirectResponse(url="/login?signup=success", status_code=303)
+        return see_other("/login?signup=success")
         
     except (ListkyError, UserAlreadyExistsError) as e:
         return templates.TemplateResponse("signup.html", {
@@ -90,13 +210,13 @@ async def login(request: Request, username: str = Form(...), pin: str = Form(...
                db = Depends(get_db)):
     try:
         client_ip = get_client_ip(request)
-        result = authenticate_user(username, pin, client_ip, db)
+        result = await authenticate_user_async(username, pin, client_ip, db)
         
         # Create session
         session_token = create_session(result["username"])
         
         # Set cookie and redirect
-        response = RedirectResponse(url="/", status_code=303)
+        response = see_other("/")
         response.set_cookie(
             key="session",
             value=session_token,
@@ -118,43 +238,42 @@ async def logout(request: Request):
     if session_token:
         clear_session(session_token)
     
-    response = RedirectResponse(url="/", status_code=303)
+    response = see_other("/")
     response.delete_cookie(key="session")
     return response
 
+# Health checks hit this constantly; the body never changes, so encode it once
+_STATUS_BODY = orjson.dumps({"status": "ok", "version": "1.0"})
+
 @app.get("/status")
 async def status():
-    return {"status": "ok", "version": "1.0"}
+    return Response(content=_STATUS_BODY, media_type="application/json")
+
+@app.get("/healthz/pool")
+async def pool_health():
+    return pool_stats()
 
 @app.get("/{username}", response_class=HTMLResponse)
-async def user_profile(username: str, request: Request, db = Depends(get_db)):
-    username = username.lower()
-    
-    if not is_valid_username(username):
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    user_info = get_user_info(username, db)
+async def user_profile(request: Request, username: str = Depends(norm_user), db = Depends(get_db)):
+    user_info = await asyncio.to_thread(get_user_info, username, db)
     if not user_info:
         raise HTTPException(status_code=404, detail="User not found")
     
-    public_lists = get_user_lists(username, include_private=False, db=db)
+    public_lists = await asyncio.to_thread(get_user_lists, username, False, db)
     
     context = {
         "request": request,
         "user_info": user_info,
         "username": username,
         "lists": public_lists,
-        "current_user": get_session_user(request)
+        "current_user": request.state.current_user
     }
     
-    return templates.TemplateResponse("user_profile.html", context)
+    return stream_template("user_profile.html", context)
 
 @app.get("/{username}/create", response_class=HTMLResponse)
-async def create_list_form(username: str, request: Request):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
+async def create_list_form(request: Request, username: str = Depends(norm_user),
+                           current_user: str = Depends(require_owner)):
     context = {
         "request": request,
         "username": username
@@ -162,17 +281,13 @@ async def create_list_form(username: str, request: Request):
     return templates.TemplateResponse("create_list.html", context)
 
 @app.post("/{username}/create")
-async def create_list_handler(username: str, request: Request, 
+async def create_list_handler(request: Request, username: str = Depends(norm_user),
                             title: str = Form(...), slug: str = Form(...), 
                             content: str = Form(...), is_public: bool = Form(False), 
-                            db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
+                            current_user: str = Depends(require_owner), db = Depends(get_db)):
     try:
-        result = create_list(username, slug, title, content, is_public, db)
-        return RedirectResponse(url=f"/{username}/{slug}", status_code=303)
+        result = await asyncio.to_thread(create_list, username, slug, title, content, is_public, db)
+        return see_other(f"/{username}/{slug}")
         
     except ListkyError as e:
         context = {
@@ -187,13 +302,10 @@ async def create_list_handler(username: str, request: Request,
         return templates.TemplateResponse("create_list.html", context)
 
 @app.get("/{username}/manage", response_class=HTMLResponse)
-async def manage_lists(username: str, request: Request, db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
+async def manage_lists(request: Request, username: str = Depends(norm_user),
+                       current_user: str = Depends(require_owner), db = Depends(get_db)):
     # Get all lists (including private ones)
-    lists = get_user_lists(username, include_private=True, db=db)
+    lists = await asyncio.to_thread(get_user_lists, username, True, db)
     
     context = {
         "request": request,
@@ -204,53 +316,53 @@ async def manage_lists(username: str, request: Request, db = Depends(get_db)):
     return templates.TemplateResponse("manage_lists.html", context)
 
 @app.get("/{username}/{slug}", response_class=HTMLResponse)
-async def view_list(username: str, slug: str, request: Request, db = Depends(get_db)):
-    username = username.lower()
-    
-    if not is_valid_username(username) or not is_valid_slug(slug):
-        raise HTTPException(status_code=404, detail="List not found")
-    
-    list_data = get_list(username, slug, db)
+async def view_list(request: Request, background_tasks: BackgroundTasks,
+                    username: str = Depends(norm_user), slug: str = Depends(norm_slug),
+                    db = Depends(get_db)):
+    list_data = await asyncio.to_thread(get_list, username, slug, db)
     if not list_data:
         raise HTTPException(status_code=404, detail="List not found")
     
-    current_user = get_session_user(request)
+    current_user = request.state.current_user
     
     # Check if list is private and user doesn't have access
     if not list_data["is_public"] and current_user != username:
-        return HTMLResponse(content="""
-        <html>
-            <head><title>Private List - listky.top</title></head>
-            <body style="font-family: system-ui; padding: 20px; max-width: 600px; margin: 0 auto;">
-                <h1>Private List</h1>
-                <p>This list is private and not publicly accessible.</p>
-                <p><a href="/{username}">← Back to {username}'s profile</a> | <a href="/">← Home</a></p>
-            </body>
-        </html>
-        """.format(username=username))
+        return templates.TemplateResponse("private_list.html", {
+            "request": request,
+            "username": username
+        })
     
-    # Record view for public lists only
+    # Record view for public lists only, after the page has been sent.
+    # The request's db connection is released by then, so the task doesn't get it.
     if list_data["is_public"]:
-        record_list_view(username, slug, request, db)
+        background_tasks.add_task(record_list_view, username, slug, get_client_ip(request))
+    
+    # Anonymous views of a public list are the same page for everyone, so let browsers and
+    # proxies revalidate with an ETag instead of downloading and re-rendering it
+    cache_headers = {}
+    if list_data["is_public"] and current_user is None:
+        version = f"{VIEW_LIST_VERSION}\0{list_data['updated_at']}\0{list_data['title']}\0{list_data['formatted_content']}"
+        etag = 'W/"%s"' % hashlib.blake2b(version.encode('utf-8'), digest_size=16).hexdigest()
+        cache_headers = {"ETag": etag, "Cache-Control": "public, max-age=60", "Vary": "Cookie"}
+        if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+            return Response(status_code=304, headers=cache_headers)
     
-    # Don't double-process the content - let the JavaScript handle formatting
+    # Content is formatted once when the list is saved; the page just inserts the stored HTML
     context = {
         "request": request,
         "list": list_data,
         "username": username,
-        "formatted_content": list_data["content"],  # Use raw content, let JS format it
+        "formatted_content": list_data["formatted_content"],
         "current_user": current_user
     }
     
-    return templates.TemplateResponse("view_list.html", context)
+    return stream_template("view_list.html", context, headers=cache_headers)
 
 @app.get("/{username}/{slug}/edit", response_class=HTMLResponse)
-async def edit_list_form(username: str, slug: str, request: Request, db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
-    list_data = get_list(username, slug, db)
+async def edit_list_form(request: Request,
+                         username: str = Depends(norm_user), slug: str = Depends(norm_slug),
+                         current_user: str = Depends(require_owner), db = Depends(get_db)):
+    list_data = await asyncio.to_thread(get_list, username, slug, db)
     if not list_data:
         raise HTTPException(status_code=404, detail="List not found")
     
@@ -262,19 +374,17 @@ async def edit_list_form(username: str, slug: str, request: Request, db = Depend
     return templates.TemplateResponse("edit_list.html", context)
 
 @app.post("/{username}/{slug}/update")
-async def update_list_handler(username: str, slug: str, request: Request,
+async def update_list_handler(request: Request,
+                            username: str = Depends(norm_user), slug: str = Depends(norm_slug),
                             title: str = Form(...), content: str = Form(...),
-                            is_public: bool = Form(False), db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-
+                            is_public: bool = Form(False),
+                            current_user: str = Depends(require_owner), db = Depends(get_db)):
     try:
-        result = update_list(username, slug, title, content, is_public, db)
-        return RedirectResponse(url=f"/{username}/{slug}", status_code=303)
+        result = await asyncio.to_thread(update_list, username, slug, title, content, is_public, db)
+        return see_other(f"/{username}/{slug}")
         
     except ListkyError as e:
-        list_data = get_list(username, slug, db)
+        list_data = await asyncio.to_thread(get_list, username, slug, db)
         context = {
             "request": request,
             "username": username,
@@ -286,54 +396,13 @@ async def update_list_handler(username: str, slug: str, request: Request,
         }
         return templates.TemplateResponse("edit_list.html", context)
 
-@app.get("/{username}/{slug}/delete", response_class=HTMLResponse)
-async def delete_list_form(username: str, slug: str, request: Request, db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
-    list_data = get_list(username, slug, db)
-    if not list_data:
-        raise HTTPException(status_code=404, detail="List not found")
-    
-    return HTMLResponse(content=f"""
-    <html>
-        <head>
-            <title>Delete List - listky.top</title>
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <style>
-                body {{ font-family: system-ui, -apple-system, sans-serif; padding: 20px; max-width: 600px; margin: 0 auto; line-height: 1.5; }}
-                .form-group {{ margin: 1rem 0; }}
-                button {{ background: #dc3545; color: white; border: none; padding: 0.75rem 1.5rem; border-radius: 4px; cursor: pointer; font-size: 1rem; }}
-                button:hover {{ background: #c82333; }}
-                .back a {{ color: #007acc; text-decoration: none; }}
-            </style>
-        </head>
-        <body>
-            <h1>Delete List</h1>
-            <p>Are you sure you want to delete "<strong>{list_data['title']}</strong>"?</p>
-            <p><strong>This action cannot be undone.</strong></p>
-            
-            <form method="post" action="/{username}/{slug}/delete">
-                <button type="submit">🗑️ Yes, Delete This List</button>
-            </form>
-            
-            <p style="margin-top: 2rem;" class="back">
-                <a href="/{username}/{slug}">← Cancel and Go Back</a>
-            </p>
-        </body>
-    </html>
-    """)
-
 @app.post("/{username}/{slug}/delete")
-async def delete_list_handler(username: str, slug: str, request: Request, db = Depends(get_db)):
-    current_user = get_session_user(request)
-    if not current_user or current_user.lower() != username.lower():
-        raise HTTPException(status_code=403, detail="Access denied")
-    
+async def delete_list_handler(request: Request,
+                              username: str = Depends(norm_user), slug: str = Depends(norm_slug),
+                              current_user: str = Depends(require_owner), db = Depends(get_db)):
     try:
-        result = delete_list(username, slug, db)
-        return RedirectResponse(url=f"/{username}/manage", status_code=303)
+        result = await asyncio.to_thread(delete_list, username, slug, db)
+        return see_other(f"/{username}/manage")
         
     except ListNotFoundError:
         raise HTTPException(status_code=404, detail="List not found")
\ No newline at end of file
@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # templates and static files are resolved relative to the project root
+
+import core.database
+core.database.DATABASE = os.path.join(tempfile.mkdtemp(), "listky.db")
+
+import main
+from core.auth import _parse_session, create_session
+from fastapi.testclient import TestClient
+
+class MalformedSessionCookieTest(unittest.TestCase):
+    def test_parse_rejects_garbage(self):
+        for token in ["", "a", "a.b.c", "a.123.é", "é.123.é", "a.123.abc.def", create_session("alice") + "x"]:
+            self.assertIsNone(_parse_session(token), token)
+
+    def test_parse_accepts_own_token(self):
+        self.assertEqual(_parse_session(create_session("alice"))[0], "alice")
+
+    def test_garbage_cookie_is_treated_as_logged_out(self):
+        # Raw header bytes: a browser can send a non-ASCII cookie, httpx's cookie jar can't
+        headers = [(b"cookie", "session=a.123.é".encode('utf-8'))]
+        with TestClient(main.app) as client:
+            for path in ["/", "/status", "/alice"]:
+                self.assertNotEqual(client.get(path, headers=headers).status_code, 500, path)
+            response = client.get("/logout", headers=headers, follow_redirects=False)
+            self.assertEqual(response.status_code, 303)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.formatting import format_content
+
+def link(url: str) -> str:
+    return f'<a href="{url}" target="_blank" rel="noopener">{url}</a>'
+
+class FormatContentTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(format_content(""), "")
+        self.assertEqual(format_content("\n  \n"), "")
+
+    def test_lines_and_bullets(self):
+        self.assertEqual(format_content("- one\n\n• two\nthree"), "<ul><li>one</li><li>two</li><li>three</li></ul>")
+
+    def test_script_is_escaped(self):
+        self.assertEqual(format_content("<script>alert(1)</script>"),
+                         "<ul><li>&lt;script&gt;alert(1)&lt;/script&gt;</li></ul>")
+
+    def test_double_quoted_url(self):
+        self.assertEqual(format_content('see "http://x.com" now'),
+                         f"<ul><li>see &#34;{link('http://x.com')}&#34; now</li></ul>")
+
+    def test_single_quoted_url(self):
+        self.assertEqual(format_content("'http://x.com'"),
+                         f"<ul><li>&#39;{link('http://x.com')}&#39;</li></ul>")
+
+    def test_angle_bracketed_url(self):
+        self.assertEqual(format_content("<http://x.com/a?b=1&c=2>"),
+                         f"<ul><li>&lt;{link('http://x.com/a?b=1&amp;c=2')}&gt;</li></ul>")
+
+    def test_url_cannot_break_out_of_href(self):
+        self.assertEqual(format_content('http://x.com/"onmouseover=alert(1)'),
+                         f"<ul><li>{link('http://x.com/')}&#34;onmouseover=alert(1)</li></ul>")
+
+    def test_bold_and_italic(self):
+        self.assertEqual(format_content("a **b <i>** *c http://x.com*"),
+                         f"<ul><li>a <strong>b &lt;i&gt;</strong> <em>c {link('http://x.com')}</em></li></ul>")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,8 +9,8 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
     
-    // Format existing list content for viewing
-    const listContentElements = document.querySelectorAll('.list-content');
+    // Format existing list content for viewing (skipping content the server already formatted)
+    const listContentElements = document.querySelectorAll('.list-content:not([data-formatted])');
     listContentElements.forEach(element => {
         formatContentForDisplay(element);
     });